@@ -1,6 +1,8 @@
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import Response
+import asyncio
+import os
 import time
 import random
 import psutil
@@ -13,6 +15,26 @@ REQ_DURATION = Histogram('http_request_duration_seconds', 'Duration seconds', ['
 CPU = Gauge('system_cpu_usage_percent', 'CPU percent', registry=registry)
 MEM = Gauge('system_memory_usage_bytes', 'Memory bytes', registry=registry)
 
+# Bound label children, cached so the hot path skips Prometheus' per-call label lookup
+_req_count_cache = {}
+_req_duration_cache = {}
+
+def _get_counter(method, path, status):
+    key = (method, path, status)
+    child = _req_count_cache.get(key)
+    if child is None:
+        child = _req_count_cache[key] = REQ_COUNT.labels(method, path, status)
+    return child
+
+def _get_histogram(method, path):
+    key = (method, path)
+    child = _req_duration_cache.get(key)
+    if child is None:
+        child = _req_duration_cache[key] = REQ_DURATION.labels(method, path)
+    return child
+
+METRICS_SAMPLE_INTERVAL = float(os.environ.get('METRICS_SAMPLE_INTERVAL', '5'))
+
 app = FastAPI(title="Sample Observability App")
 
 app.add_middleware(
@@ -20,23 +42,50 @@ app.add_middleware(
     allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
 )
 
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    start = time.time()
-    CPU.set(psutil.cpu_percent())
-    MEM.set(psutil.virtual_memory().used)
-
-    try:
-        response = await call_next(request)
-        status = str(response.status_code)
-    except Exception:
-        status = "500"
-        raise
-    finally:
-        dur = time.time() - start
-        REQ_COUNT.labels(request.method, request.url.path, status).inc()
-        REQ_DURATION.labels(request.method, request.url.path).observe(dur)
-    return response
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method = scope["method"]
+        status_holder = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            dur = time.perf_counter() - start
+            # Label by route template (e.g. /items/{id}) so path params don't create a series each;
+            # unmatched paths (404s, scanners) share one label to keep series and caches bounded
+            route = scope.get("route")
+            path = route.path if route is not None else "<unmatched>"
+            _get_counter(method, path, status_holder[0]).inc()
+            _get_histogram(method, path).observe(dur)
+
+app.add_middleware(MetricsMiddleware)
+
+async def _sample_system_metrics():
+    while True:
+        CPU.set(psutil.cpu_percent(interval=None))
+        MEM.set(psutil.virtual_memory().used)
+        await asyncio.sleep(METRICS_SAMPLE_INTERVAL)
+
+@app.on_event("startup")
+async def start_system_metrics_sampler():
+    app.state.system_metrics_task = asyncio.create_task(_sample_system_metrics())
+
+@app.on_event("shutdown")
+async def stop_system_metrics_sampler():
+    app.state.system_metrics_task.cancel()
 
 @app.get("/")
 async def root():
@@ -49,7 +98,7 @@ async def health():
 @app.get("/api/simulate/load")
 async def simulate_load():
     d = random.uniform(0.1, 1.0)
-    time.sleep(d)
+    await asyncio.sleep(d)
     return {"simulated_seconds": d}
 
 @app.get("/api/simulate/error")
@@ -1,13 +1,20 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Response
+from fastapi import FastAPI, APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
+import asyncio
+import hashlib
 import os
 import logging
+import orjson
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, TypedDict
+import time
 import uuid
+import yaml
 from datetime import datetime
 
 
@@ -16,11 +23,26 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Observability data favours throughput: acknowledged-by-primary writes without journal waits,
+# a larger pool for concurrent handlers, and wire compression (zlib ships with every pymongo build)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=100,
+    w=1,
+    journal=False,
+    retryWrites=True,
+    compressors="zlib",
+)
 db = client[os.environ['DB_NAME']]
 
+# Cursor batch size for list endpoints; documents are decoded batch by batch while streaming
+LIST_BATCH_SIZE = 500
+
+# Upper bound on documents accepted by a single batch insert request
+MAX_STATUS_BATCH_SIZE = 1000
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -39,6 +61,16 @@ class StatusCheckCreate(BaseModel):
     client_name: str
 
 
+# Second-granularity UTC timestamp for /health, refreshed by a background task
+_now_iso = ["1970-01-01T00:00:00Z"]
+
+
+async def _refresh_now_iso():
+    while True:
+        _now_iso[0] = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+        await asyncio.sleep(1)
+
+
 @api_router.get("/")
 async def root():
     return {"message": "Hello World"}
@@ -57,38 +89,58 @@ async def health():
     return {
         "status": "ok",
         "db": "ok" if db_ok else "unavailable",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": _now_iso[0],
     }
 
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_obj = StatusCheck(**input.model_dump())
+    status_obj = StatusCheck.model_construct(client_name=input.client_name)
+    doc = status_obj.model_dump()
     try:
-        await db.status_checks.insert_one(status_obj.model_dump())
+        # insert_one adds _id to the dict it is given; keep the response copy clean
+        await db.status_checks.insert_one(dict(doc))
     except Exception as e:
         logging.exception("Failed to insert status check")
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
-    return status_obj
+    return ORJSONResponse(doc)
+
+
+@api_router.post("/status/batch", response_model=List[StatusCheck])
+async def create_status_checks_batch(
+    # Enforced during validation, which stops one item past the cap instead of validating the whole list
+    inputs: Annotated[List[StatusCheckCreate], Field(max_length=MAX_STATUS_BATCH_SIZE)],
+):
+    docs = [StatusCheck.model_construct(client_name=i.client_name).model_dump() for i in inputs]
+    if not docs:
+        return ORJSONResponse(docs)
+    try:
+        await db.status_checks.insert_many([dict(d) for d in docs], ordered=False)
+    except BulkWriteError as e:
+        # Unordered inserts keep going past failures; tell the client which ids landed so a retry doesn't duplicate them
+        failed = {err["index"] for err in e.details.get("writeErrors", [])}
+        logging.exception("Failed to insert part of status checks batch")
+        raise HTTPException(status_code=500, detail={
+            "error": "Database error: batch partially inserted",
+            "inserted_ids": [d["id"] for i, d in enumerate(docs) if i not in failed],
+            "failed_indexes": sorted(failed),
+        })
+    except Exception as e:
+        logging.exception("Failed to insert status checks batch")
+        raise HTTPException(status_code=500, detail=f"Database error: {e}")
+    return ORJSONResponse(docs)
 
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
+    cur = db.status_checks.find({}, {"_id": 0}).sort("timestamp", -1).limit(1000).batch_size(LIST_BATCH_SIZE)
     try:
-        status_checks = await db.status_checks.find().sort("timestamp", -1).limit(1000).to_list(1000)
+        # Documents were validated on insert; return them as-is, bypassing response_model re-validation
+        return ORJSONResponse([doc async for doc in cur])
     except Exception as e:
         logging.exception("Failed to fetch status checks")
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
 
-    cleaned: List[StatusCheck] = []
-    for doc in status_checks:
-        doc.pop('_id', None)
-        try:
-            cleaned.append(StatusCheck(**doc))
-        except Exception as e:
-            logging.warning(f"Skipping invalid document: {e}; doc={doc}")
-    return cleaned
-
 
 # =====================================
 # Control Plane (Projects, Sinks, Agents)
@@ -136,46 +188,42 @@ class Agent(AgentCreate):
 
 @api_router.post("/projects", response_model=Project)
 async def create_project(payload: ProjectCreate):
-    prj = Project(**payload.model_dump())
+    prj = Project.model_construct(**dict(payload))
+    doc = prj.model_dump()
     try:
-        await db.projects.insert_one(prj.model_dump())
+        # insert_one adds _id to the dict it is given; keep the response copy clean
+        await db.projects.insert_one(dict(doc))
     except Exception as e:
         logging.exception("Failed to insert project")
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
-    return prj
+    return ORJSONResponse(doc)
 
 
 @api_router.get("/projects", response_model=List[Project])
 async def list_projects():
-    items = await db.projects.find().sort("created_at", -1).to_list(1000)
-    out: List[Project] = []
-    for it in items:
-        it.pop('_id', None)
-        out.append(Project(**it))
-    return out
+    cur = db.projects.find({}, {"_id": 0}).sort("created_at", -1).limit(1000).batch_size(LIST_BATCH_SIZE)
+    return ORJSONResponse([it async for it in cur])
 
 
 @api_router.post("/sinks", response_model=Sink)
 async def create_sink(payload: SinkCreate):
     if payload.type not in SUPPORTED_SINK_TYPES:
         raise HTTPException(status_code=400, detail=f"Unsupported sink type. Allowed: {sorted(SUPPORTED_SINK_TYPES)}")
-    sk = Sink(**payload.model_dump())
+    sk = Sink.model_construct(**dict(payload))
+    doc = sk.model_dump()
     try:
-        await db.sinks.insert_one(sk.model_dump())
+        # insert_one adds _id to the dict it is given; keep the response copy clean
+        await db.sinks.insert_one(dict(doc))
     except Exception as e:
         logging.exception("Failed to insert sink")
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
-    return sk
+    return ORJSONResponse(doc)
 
 
 @api_router.get("/sinks", response_model=List[Sink])
 async def list_sinks():
-    items = await db.sinks.find().sort("created_at", -1).to_list(1000)
-    out: List[Sink] = []
-    for it in items:
-        it.pop('_id', None)
-        out.append(Sink(**it))
-    return out
+    cur = db.sinks.find({}, {"_id": 0}).sort("created_at", -1).limit(1000).batch_size(LIST_BATCH_SIZE)
+    return ORJSONResponse([it async for it in cur])
 
 
 @api_router.post("/agents", response_model=Agent)
@@ -184,39 +232,35 @@ async def create_agent(payload: AgentCreate):
         raise HTTPException(status_code=400, detail=f"Unsupported agent mode. Allowed: {sorted(SUPPORTED_AGENT_MODES)}")
     # Validate sinks exist
     if payload.sink_ids:
-        found_ids = set()
-        async for s in db.sinks.find({"id": {"$in": payload.sink_ids}}):
-            found_ids.add(s.get("id"))
-        missing = set(payload.sink_ids) - found_ids
+        found_ids = await db.sinks.distinct("id", {"id": {"$in": payload.sink_ids}})
+        missing = set(payload.sink_ids) - set(found_ids)
         if missing:
             raise HTTPException(status_code=400, detail=f"Unknown sink_ids: {sorted(missing)}")
 
-    ag = Agent(**payload.model_dump())
+    ag = Agent.model_construct(**dict(payload))
+    doc = ag.model_dump()
     try:
-        await db.agents.insert_one(ag.model_dump())
+        # insert_one adds _id to the dict it is given; keep the response copy clean
+        await db.agents.insert_one(dict(doc))
     except Exception as e:
         logging.exception("Failed to insert agent")
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
-    return ag
+    return ORJSONResponse(doc)
 
 
 @api_router.get("/agents", response_model=List[Agent])
 async def list_agents():
-    items = await db.agents.find().sort("created_at", -1).to_list(1000)
-    out: List[Agent] = []
-    for it in items:
-        it.pop('_id', None)
-        out.append(Agent(**it))
-    return out
+    cur = db.agents.find({}, {"_id": 0}).sort("created_at", -1).limit(1000).batch_size(LIST_BATCH_SIZE)
+    return ORJSONResponse([it async for it in cur])
 
 
 @api_router.get("/agents/{agent_id}", response_model=Agent)
 async def get_agent(agent_id: str):
-    doc = await db.agents.find_one({"id": agent_id})
+    doc = await db.agents.find_one({"id": agent_id}, {"_id": 0})
     if not doc:
         raise HTTPException(status_code=404, detail="Agent not found")
-    doc.pop('_id', None)
-    return Agent(**doc)
+    # Validated on insert; returning a Response skips response_model re-validation
+    return ORJSONResponse(doc)
 
 
 @api_router.post("/agents/{agent_id}/rotate_token", response_model=Dict[str, str])
@@ -225,51 +269,105 @@ async def rotate_agent_token(agent_id: str):
     res = await db.agents.update_one({"id": agent_id}, {"$set": {"token": new_token}})
     if res.matched_count == 0:
         raise HTTPException(status_code=404, detail="Agent not found")
+    _invalidate_config_cache(agent_id)
     return {"id": agent_id, "token": new_token}
 
 
 # ------------------------------
 # Config Generation (OTel Collector)
 # ------------------------------
+# Prefer the libyaml-backed dumper; fall back to pure Python when PyYAML lacks the C extension
+class _YAMLDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    # Pipelines share one exporter list; emit it inline rather than as &id001/*id001 aliases
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+# JSON is valid collector config too (YAML is a superset) and renders far faster than YAML
+CONFIG_MEDIA_TYPES = {"yaml": "text/yaml", "json": "application/json"}
+
+# Rendered configs keyed by (agent_id, signals, prometheus_exporter_port, format) -> (rendered_at, body, etag).
+# Collector agents poll their config; serve repeat pulls without hitting Mongo for a short TTL.
+# Entries are kept in insertion (= render time) order, so expired and overflow entries sit at the front.
+CONFIG_CACHE_TTL_SECONDS = 10.0
+CONFIG_CACHE_MAX_ENTRIES = 1024
+_config_cache: Dict[Tuple[str, Tuple[str, ...], Optional[int], str], Tuple[float, bytes, str]] = {}
+
+
+def _store_config(key: Tuple[str, Tuple[str, ...], Optional[int], str], content: bytes, etag: str) -> None:
+    now = time.monotonic()
+    _config_cache.pop(key, None)
+    while _config_cache:
+        oldest = next(iter(_config_cache))
+        if now - _config_cache[oldest][0] < CONFIG_CACHE_TTL_SECONDS and len(_config_cache) < CONFIG_CACHE_MAX_ENTRIES:
+            break
+        del _config_cache[oldest]
+    _config_cache[key] = (now, content, etag)
+
+
+def _invalidate_config_cache(agent_id: str) -> None:
+    # Call from any write that changes an existing agent or one of its sinks. Creating agents or sinks
+    # needs no invalidation: a new agent has no cached renders, and sink_ids are fixed at agent creation.
+    for key in [k for k in _config_cache if k[0] == agent_id]:
+        _config_cache.pop(key, None)
+
+
+class SinkDoc(TypedDict):
+    """Stored sink document, as read by the config builder (validated on insert)."""
+    type: str
+    config: Dict[str, Any]
+
+
 class ConfigRequest(BaseModel):
     signals: List[str] = Field(default_factory=lambda: ["metrics"])  # subset of SUPPORTED_SIGNALS
     prometheus_exporter_port: Optional[int] = None  # if sink type 'prometheus' selected
 
 
-def _yaml_dump_like(d: Any, indent: int = 0) -> str:
-    """Very small YAML emitter for simple dict/list/scalar structures.
-    Avoids external deps. Not for complex types.
-    """
-    sp = "  " * indent
-    if isinstance(d, dict):
-        lines = []
-        for k, v in d.items():
-            if isinstance(v, (dict, list)):
-                lines.append(f"{sp}{k}:")
-                lines.append(_yaml_dump_like(v, indent + 1))
-            else:
-                if isinstance(v, str):
-                    lines.append(f"{sp}{k}: \"{v}\"")
-                else:
-                    lines.append(f"{sp}{k}: {v}")
-        return "\n".join(lines)
-    elif isinstance(d, list):
-        lines = []
-        for item in d:
-            if isinstance(item, (dict, list)):
-                lines.append(f"{sp}-")
-                lines.append(_yaml_dump_like(item, indent + 1))
-            else:
-                if isinstance(item, str):
-                    lines.append(f"{sp}- \"{item}\"")
-                else:
-                    lines.append(f"{sp}- {item}")
-        return "\n".join(lines)
-    else:
-        return f"{sp}{d}"
+def _prometheus_exporter(s: SinkDoc, prom_exporter_port: Optional[int]) -> Dict[str, Any]:
+    return {"endpoint": f"0.0.0.0:{prom_exporter_port or 8889}", "namespace": "aether"}
+
+
+def _otlp_exporter(s: SinkDoc, prom_exporter_port: Optional[int]) -> Dict[str, Any]:
+    cfg: Dict[str, Any] = {"endpoint": s["config"].get("endpoint", "localhost:4317")}
+    # allow insecure for demos
+    if s["config"].get("insecure", True):
+        cfg["tls"] = {"insecure": True}
+    return cfg
+
 
+def _kafka_exporter(s: SinkDoc, prom_exporter_port: Optional[int]) -> Dict[str, Any]:
+    return {
+        "brokers": s["config"].get("brokers", ["localhost:9092"]),
+        "topic": s["config"].get("topic", "otlp_data"),
+    }
 
-def _build_collector_config(agent: Agent, sinks: List[Sink], signals: List[str], prom_exporter_port: Optional[int]) -> Dict[str, Any]:
+
+def _splunk_hec_exporter(s: SinkDoc, prom_exporter_port: Optional[int]) -> Dict[str, Any]:
+    return {
+        "token": s["config"].get("token", "CHANGE_ME"),
+        "endpoint": s["config"].get("endpoint", "https://splunk:8088/services/collector"),
+        "insecure_skip_verify": True,
+    }
+
+
+def _elasticsearch_exporter(s: SinkDoc, prom_exporter_port: Optional[int]) -> Dict[str, Any]:
+    return {
+        "endpoints": s["config"].get("endpoints", ["http://elasticsearch:9200"]),
+        "index": s["config"].get("index", "app-logs-%{+yyyy.MM.dd}"),
+    }
+
+
+# Sink type -> exporter config builder; the exporter is registered under the sink type's name
+_SINK_EXPORTER_BUILDERS: Dict[str, Callable[[SinkDoc, Optional[int]], Dict[str, Any]]] = {
+    "prometheus": _prometheus_exporter,
+    "otlp": _otlp_exporter,
+    "kafka": _kafka_exporter,
+    "splunk_hec": _splunk_hec_exporter,
+    "elasticsearch": _elasticsearch_exporter,
+}
+
+
+def _build_collector_config(agent: Agent, sinks: List[SinkDoc], signals: List[str], prom_exporter_port: Optional[int]) -> Dict[str, Any]:
     # Receivers
     receivers: Dict[str, Any] = {
         "otlp": {
@@ -305,41 +403,11 @@ def _build_collector_config(agent: Agent, sinks: List[Sink], signals: List[str],
     enabled_exporters: List[str] = []
 
     for s in sinks:
-        if s.type == "prometheus":
-            port = prom_exporter_port or 8889
-            exporters["prometheus"] = {
-                "endpoint": f"0.0.0.0:{port}",
-                "namespace": "aether",
-            }
-            enabled_exporters.append("prometheus")
-        elif s.type == "otlp":
-            cfg = {
-                "endpoint": s.config.get("endpoint", "localhost:4317"),
-            }
-            # allow insecure for demos
-            if s.config.get("insecure", True):
-                cfg["tls"] = {"insecure": True}
-            exporters["otlp"] = cfg
-            enabled_exporters.append("otlp")
-        elif s.type == "kafka":
-            exporters["kafka"] = {
-                "brokers": s.config.get("brokers", ["localhost:9092"]),
-                "topic": s.config.get("topic", "otlp_data"),
-            }
-            enabled_exporters.append("kafka")
-        elif s.type == "splunk_hec":
-            exporters["splunk_hec"] = {
-                "token": s.config.get("token", "CHANGE_ME"),
-                "endpoint": s.config.get("endpoint", "https://splunk:8088/services/collector"),
-                "insecure_skip_verify": True,
-            }
-            enabled_exporters.append("splunk_hec")
-        elif s.type == "elasticsearch":
-            exporters["elasticsearch"] = {
-                "endpoints": s.config.get("endpoints", ["http://elasticsearch:9200"]),
-                "index": s.config.get("index", "app-logs-%{+yyyy.MM.dd}"),
-            }
-            enabled_exporters.append("elasticsearch")
+        builder = _SINK_EXPORTER_BUILDERS.get(s["type"])
+        if builder is None:
+            continue
+        exporters[s["type"]] = builder(s, prom_exporter_port)
+        enabled_exporters.append(s["type"])
 
     # Pipelines by signals
     pipelines: Dict[str, Any] = {}
@@ -375,31 +443,82 @@ def _build_collector_config(agent: Agent, sinks: List[Sink], signals: List[str],
     return cfg
 
 
-@api_router.post("/agents/{agent_id}/config")
-async def generate_config(agent_id: str, body: ConfigRequest):
-    # Load agent
-    a_doc = await db.agents.find_one({"id": agent_id})
-    if not a_doc:
-        raise HTTPException(status_code=404, detail="Agent not found")
-    a_doc.pop('_id', None)
-    agent = Agent(**a_doc)
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison per RFC 9110 §13.1.2: "*", comma-separated lists, weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _config_headers(etag: str) -> Dict[str, str]:
+    # no-cache: clients may keep the body but must revalidate via If-None-Match, so a token rotation
+    # is seen on the next poll instead of after a client-side max-age
+    return {"ETag": etag, "Cache-Control": "no-cache"}
 
-    # Load sinks
-    sinks: List[Sink] = []
-    if agent.sink_ids:
-        cur = db.sinks.find({"id": {"$in": agent.sink_ids}})
-        async for s in cur:
-            s.pop('_id', None)
-            sinks.append(Sink(**s))
 
+async def _render_config(agent_id: str, requested_signals: List[str], prom_exporter_port: Optional[int], fmt: str) -> Tuple[bytes, str]:
+    """Return (body, etag) for an agent's collector config, served from the TTL cache when fresh."""
     # Validate signals
-    signals = [s for s in body.signals if s in SUPPORTED_SIGNALS]
+    signals = [s for s in requested_signals if s in SUPPORTED_SIGNALS]
     if not signals:
         signals = ["metrics"]
 
-    cfg = _build_collector_config(agent, sinks, signals, body.prometheus_exporter_port)
-    yaml_text = _yaml_dump_like(cfg)
-    return Response(content=yaml_text, media_type="text/yaml")
+    cache_key = (agent_id, tuple(sorted(set(signals))), prom_exporter_port, fmt)
+    cached = _config_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < CONFIG_CACHE_TTL_SECONDS:
+        return cached[1], cached[2]
+
+    # Load agent and its sinks in a single round-trip
+    pipeline = [
+        {"$match": {"id": agent_id}},
+        {"$limit": 1},
+        {"$lookup": {"from": "sinks", "localField": "sink_ids", "foreignField": "id", "as": "sinks"}},
+        {"$project": {"_id": 0, "sinks._id": 0}},
+    ]
+    docs = await db.agents.aggregate(pipeline).to_list(1)
+    if not docs:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    a_doc = docs[0]
+    s_docs = a_doc.pop('sinks', [])
+    # Stored documents were validated on insert; skip re-validation on this hot path
+    agent = Agent.model_construct(**a_doc)
+    sinks: List[SinkDoc] = s_docs
+
+    cfg = _build_collector_config(agent, sinks, signals, prom_exporter_port)
+    if fmt == "json":
+        content = orjson.dumps(cfg)
+    else:
+        content = yaml.dump(cfg, Dumper=_YAMLDumper, default_flow_style=False, sort_keys=False).encode("utf-8")
+    etag = '"%s"' % hashlib.blake2b(content, digest_size=16).hexdigest()
+    _store_config(cache_key, content, etag)
+    return content, etag
+
+
+@api_router.post("/agents/{agent_id}/config")
+async def generate_config(
+    agent_id: str,
+    body: ConfigRequest,
+    fmt: str = Query("yaml", alias="format", pattern="^(yaml|json)$"),
+):
+    content, etag = await _render_config(agent_id, body.signals, body.prometheus_exporter_port, fmt)
+    return Response(content=content, media_type=CONFIG_MEDIA_TYPES[fmt], headers=_config_headers(etag))
+
+
+@api_router.get("/agents/{agent_id}/config")
+async def get_config(
+    agent_id: str,
+    signals: List[str] = Query(["metrics"]),
+    prometheus_exporter_port: Optional[int] = None,
+    fmt: str = Query("yaml", alias="format", pattern="^(yaml|json)$"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """Conditional variant for polling collectors: answers 304 when If-None-Match matches."""
+    content, etag = await _render_config(agent_id, signals, prometheus_exporter_port, fmt)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=_config_headers(etag))
+    return Response(content=content, media_type=CONFIG_MEDIA_TYPES[fmt], headers=_config_headers(etag))
 
 
 # Include the router in the main app
@@ -421,6 +540,31 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _ensure_indexes():
+    """Index lookup keys and list sort keys so queries avoid collection scans."""
+    indexes = [(coll, "id", {"unique": True}) for coll in (db.agents, db.sinks, db.projects, db.status_checks)]
+    indexes += [(coll, [("created_at", -1)], {}) for coll in (db.agents, db.sinks, db.projects)]
+    indexes.append((db.status_checks, [("timestamp", -1)], {}))
+    for coll, keys, opts in indexes:
+        try:
+            await coll.create_index(keys, **opts)
+        except Exception:
+            logger.exception(f"Failed to create index {keys} on {coll.name}")
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    # Built in the background so an unreachable Mongo doesn't hold up startup for the server selection timeout
+    app.state.index_task = asyncio.create_task(_ensure_indexes())
+
+
+@app.on_event("startup")
+async def start_clock():
+    app.state.clock_task = asyncio.create_task(_refresh_now_iso())
+
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    app.state.clock_task.cancel()
+    app.state.index_task.cancel()
     client.close()
\ No newline at end of file
@@ -1,4 +1,5 @@
-import requests
+import asyncio
+import httpx
 import sys
 import json
 from datetime import datetime
@@ -8,8 +9,18 @@ class AetherCollectAPITester:
         self.base_url = base_url
         self.tests_run = 0
         self.tests_passed = 0
+        self.client = None
 
-    def run_test(self, name, method, endpoint, expected_status, data=None):
+    async def __aenter__(self):
+        # One pooled HTTP/2 connection shared by all tests avoids a TLS handshake per request
+        self.client = httpx.AsyncClient(base_url=self.base_url, http2=True, timeout=10)
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.__aexit__(*exc_info)
+
+    async def run_test(self, name, method, endpoint, expected_status, data=None):
         """Run a single API test"""
         url = f"{self.base_url}/{endpoint}"
         headers = {'Content-Type': 'application/json'}
@@ -20,9 +31,9 @@ class AetherCollectAPITester:
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
+                response = await self.client.get(f"/{endpoint}", headers=headers)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = await self.client.post(f"/{endpoint}", json=data, headers=headers)
 
             print(f"Response Status: {response.status_code}")
             
@@ -46,9 +57,9 @@ class AetherCollectAPITester:
             print(f"❌ Failed - Error: {str(e)}")
             return False, {}
 
-    def test_hello_endpoint(self):
+    async def test_hello_endpoint(self):
         """Test GET /api/ endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Hello World Endpoint",
             "GET",
             "api/",
@@ -61,9 +72,9 @@ class AetherCollectAPITester:
             print("❌ Hello endpoint did not return expected message")
             return False
 
-    def test_health_endpoint(self):
+    async def test_health_endpoint(self):
         """Test GET /api/health endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Health Check Endpoint",
             "GET",
             "api/health",
@@ -78,9 +89,9 @@ class AetherCollectAPITester:
                 return False
         return False
 
-    def test_create_status(self, client_name="test-e2e"):
+    async def test_create_status(self, client_name="test-e2e"):
         """Test POST /api/status endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Create Status Check",
             "POST",
             "api/status",
@@ -94,9 +105,9 @@ class AetherCollectAPITester:
             print("❌ Status creation failed or missing required fields")
             return None
 
-    def test_get_status_checks(self, expected_client_name="test-e2e"):
+    async def test_get_status_checks(self, expected_client_name="test-e2e"):
         """Test GET /api/status endpoint"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Get Status Checks",
             "GET",
             "api/status",
@@ -122,25 +133,24 @@ class AetherCollectAPITester:
             print("❌ Failed to retrieve status checks or response is not a list")
             return False
 
-def main():
+async def main():
     print("🚀 Starting AetherCollect API Tests")
     print("=" * 50)
     
     # Setup
-    tester = AetherCollectAPITester()
-    
-    # Test 1: Hello endpoint
-    hello_success = tester.test_hello_endpoint()
-    
-    # Test 2: Health endpoint
-    health_success = tester.test_health_endpoint()
-    
-    # Test 3: Create status check
-    status_id = tester.test_create_status("test-e2e")
-    create_success = status_id is not None
-    
-    # Test 4: Get status checks
-    get_success = tester.test_get_status_checks("test-e2e")
+    async with AetherCollectAPITester() as tester:
+        # Test 1: Hello endpoint
+        hello_success = await tester.test_hello_endpoint()
+        
+        # Test 2: Health endpoint
+        health_success = await tester.test_health_endpoint()
+        
+        # Test 3: Create status check
+        status_id = await tester.test_create_status("test-e2e")
+        create_success = status_id is not None
+        
+        # Test 4: Get status checks
+        get_success = await tester.test_get_status_checks("test-e2e")
     
     # Print final results
     print("\n" + "=" * 50)
@@ -158,4 +168,4 @@ def main():
     return 0 if all_passed else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -0,0 +1,106 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT / "aether-demo-blueprint" / "sample-app"))
+
+import server  # noqa: E402
+
+
+class FakeResult:
+    def __init__(self, matched_count=0):
+        self.matched_count = matched_count
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+class FakeCollection:
+    """In-memory stand-in for the handful of Motor collection methods the backend uses."""
+
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+        self.docs = []
+        self.aggregate_calls = 0
+        self.insert_many_error = None
+
+    async def insert_one(self, doc):
+        doc["_id"] = object()
+        self.docs.append(doc)
+
+    async def insert_many(self, docs, ordered=True):
+        if self.insert_many_error:
+            raise self.insert_many_error
+        for d in docs:
+            d["_id"] = object()
+        self.docs.extend(docs)
+
+    async def find_one(self, flt, projection=None):
+        for d in self.docs:
+            if d["id"] == flt["id"]:
+                return {k: v for k, v in d.items() if k != "_id"}
+        return None
+
+    async def update_one(self, flt, update):
+        matched = [d for d in self.docs if d["id"] == flt["id"]]
+        for d in matched:
+            d.update(update["$set"])
+        return FakeResult(len(matched))
+
+    async def distinct(self, field, flt):
+        wanted = set(flt["id"]["$in"])
+        return [d[field] for d in self.docs if d["id"] in wanted]
+
+    def aggregate(self, pipeline):
+        # Only the agent + $lookup sinks pipeline used by config generation
+        self.aggregate_calls += 1
+        agent_id = pipeline[0]["$match"]["id"]
+        out = []
+        for d in self.docs:
+            if d["id"] == agent_id:
+                a_doc = {k: v for k, v in d.items() if k != "_id"}
+                a_doc["sinks"] = [
+                    {k: v for k, v in s.items() if k != "_id"}
+                    for s in self.db.sinks.docs if s["id"] in d["sink_ids"]
+                ]
+                out.append(a_doc)
+        return FakeCursor(out[:1])
+
+
+class FakeDB:
+    def __init__(self):
+        for name in ("agents", "sinks", "projects", "status_checks"):
+            setattr(self, name, FakeCollection(self, name))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = FakeDB()
+    monkeypatch.setattr(server, "db", fake)
+    server._config_cache.clear()
+    yield fake
+    server._config_cache.clear()
+
+
+@pytest.fixture
+def client(db):
+    # No context manager: startup hooks (index builds, clock task) stay off
+    return TestClient(server.app)
+
+
+@pytest.fixture
+def make_agent(client):
+    def _make(sink_types=("prometheus",)):
+        sink_ids = [client.post("/api/sinks", json={"type": t}).json()["id"] for t in sink_types]
+        return client.post("/api/agents", json={"name": "a1", "sink_ids": sink_ids}).json()
+    return _make
@@ -0,0 +1,54 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import main
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(main.MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def _count(method, endpoint, status):
+    return main.registry.get_sample_value(
+        "http_requests_total", {"method": method, "endpoint": endpoint, "status": status}
+    ) or 0
+
+
+def test_path_params_share_route_template_series():
+    client = TestClient(_app())
+    before = _count("GET", "/items/{item_id}", "200")
+    client.get("/items/1")
+    client.get("/items/2")
+    assert _count("GET", "/items/{item_id}", "200") == before + 2
+    assert _count("GET", "/items/1", "200") == 0
+    assert main._req_count_cache[("GET", "/items/{item_id}", 200)] is main.REQ_COUNT.labels("GET", "/items/{item_id}", "200")
+    assert main.registry.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "endpoint": "/items/{item_id}"}
+    ) >= 2
+
+
+def test_unmatched_paths_share_one_series():
+    client = TestClient(_app())
+    before = _count("GET", "<unmatched>", "404")
+    assert client.get("/no/such/path").status_code == 404
+    assert client.get("/another").status_code == 404
+    assert _count("GET", "<unmatched>", "404") == before + 2
+    assert _count("GET", "/no/such/path", "404") == 0
+
+
+def test_unhandled_exception_recorded_as_500():
+    client = TestClient(_app(), raise_server_exceptions=False)
+    before = _count("GET", "/boom", "500")
+    assert client.get("/boom").status_code == 500
+    assert _count("GET", "/boom", "500") == before + 1
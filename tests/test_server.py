@@ -0,0 +1,247 @@
+import json
+
+import pytest
+import yaml
+from pymongo.errors import BulkWriteError
+
+import server
+
+
+def test_config_yaml_has_no_aliases(client, make_agent):
+    agent = make_agent(("otlp",))
+    res = client.post(f"/api/agents/{agent['id']}/config", json={"signals": ["metrics", "logs", "traces"]})
+    assert res.status_code == 200
+    assert b"&id" not in res.content and b"*id" not in res.content
+
+
+# ------------------------------
+# Config cache (TTL + invalidation)
+# ------------------------------
+def test_config_served_from_cache(client, db, make_agent):
+    agent = make_agent()
+    first = client.post(f"/api/agents/{agent['id']}/config", json={})
+    second = client.post(f"/api/agents/{agent['id']}/config", json={})
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert db.agents.aggregate_calls == 1
+
+
+def test_config_cache_expires(client, db, make_agent, monkeypatch):
+    agent = make_agent()
+    client.post(f"/api/agents/{agent['id']}/config", json={})
+    real_monotonic = server.time.monotonic
+    monkeypatch.setattr(server.time, "monotonic", lambda: real_monotonic() + server.CONFIG_CACHE_TTL_SECONDS + 1)
+    client.post(f"/api/agents/{agent['id']}/config", json={})
+    assert db.agents.aggregate_calls == 2
+
+
+def test_config_cache_invalidated_on_token_rotation(client, db, make_agent):
+    agent = make_agent()
+    client.post(f"/api/agents/{agent['id']}/config", json={})
+    assert client.post(f"/api/agents/{agent['id']}/rotate_token").status_code == 200
+    client.post(f"/api/agents/{agent['id']}/config", json={})
+    assert db.agents.aggregate_calls == 2
+
+
+def test_config_cache_kept_for_other_agents(client, db, make_agent):
+    agent = make_agent()
+    other = make_agent()
+    client.post(f"/api/agents/{agent['id']}/config", json={})
+    client.post(f"/api/agents/{other['id']}/rotate_token")
+    client.post(f"/api/agents/{agent['id']}/config", json={})
+    assert db.agents.aggregate_calls == 1
+
+
+def test_config_cache_is_bounded(db, monkeypatch):
+    monkeypatch.setattr(server, "CONFIG_CACHE_MAX_ENTRIES", 3)
+    for port in range(10):
+        server._store_config(("a", ("metrics",), port, "yaml"), b"x", '"e"')
+    assert [k[2] for k in server._config_cache] == [7, 8, 9]
+
+
+def test_config_cache_drops_expired_entries_on_write(db, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    server._store_config(("a", ("metrics",), 1, "yaml"), b"x", '"e"')
+    now[0] += server.CONFIG_CACHE_TTL_SECONDS + 1
+    server._store_config(("a", ("metrics",), 2, "yaml"), b"x", '"e"')
+    assert [k[2] for k in server._config_cache] == [2]
+
+
+def test_config_unknown_agent(client):
+    assert client.post("/api/agents/missing/config", json={}).status_code == 404
+
+
+# ------------------------------
+# Agent sink validation
+# ------------------------------
+def test_create_agent_unknown_sink(client, make_agent):
+    known = make_agent()["sink_ids"][0]
+    res = client.post("/api/agents", json={"name": "a", "sink_ids": [known, "nope"]})
+    assert res.status_code == 400
+    assert "nope" in res.json()["detail"] and known not in res.json()["detail"]
+
+
+# ------------------------------
+# Get / create endpoints
+# ------------------------------
+def test_get_agent_returns_stored_document(client, db, make_agent):
+    agent = make_agent()
+    res = client.get(f"/api/agents/{agent['id']}")
+    assert res.status_code == 200
+    assert res.json() == agent
+
+
+def test_get_agent_missing(client):
+    assert client.get("/api/agents/missing").status_code == 404
+
+
+def test_create_endpoints_return_full_documents(client, db):
+    for path, payload, model, coll in (
+        ("/api/status", {"client_name": "c"}, server.StatusCheck, db.status_checks),
+        ("/api/projects", {"name": "p"}, server.Project, db.projects),
+        ("/api/sinks", {"type": "otlp"}, server.Sink, db.sinks),
+        ("/api/agents", {"name": "a"}, server.Agent, db.agents),
+    ):
+        res = client.post(path, json=payload)
+        assert res.status_code == 200
+        body = res.json()
+        assert set(body) == set(model.model_fields)
+        assert coll.docs[-1]["id"] == body["id"]
+
+
+def test_create_sink_rejects_unknown_type(client):
+    assert client.post("/api/sinks", json={"type": "bogus"}).status_code == 400
+
+
+# ------------------------------
+# Batch status inserts
+# ------------------------------
+def test_status_batch_empty(client, db):
+    res = client.post("/api/status/batch", json=[])
+    assert res.status_code == 200
+    assert res.json() == []
+    assert db.status_checks.docs == []
+
+
+def test_status_batch_inserts(client, db):
+    res = client.post("/api/status/batch", json=[{"client_name": "a"}, {"client_name": "b"}])
+    assert res.status_code == 200
+    body = res.json()
+    assert [b["client_name"] for b in body] == ["a", "b"]
+    assert [d["id"] for d in db.status_checks.docs] == [b["id"] for b in body]
+    assert all("_id" not in b for b in body)
+
+
+def test_status_batch_too_large(client, db):
+    res = client.post("/api/status/batch", json=[{"client_name": "a"}] * (server.MAX_STATUS_BATCH_SIZE + 1))
+    assert res.status_code == 422
+    assert db.status_checks.docs == []
+
+
+def test_status_batch_partial_failure(client, db):
+    db.status_checks.insert_many_error = BulkWriteError({"writeErrors": [{"index": 1, "code": 11000}], "nInserted": 2})
+    res = client.post("/api/status/batch", json=[{"client_name": n} for n in "abc"])
+    assert res.status_code == 500
+    detail = res.json()["detail"]
+    assert detail["failed_indexes"] == [1]
+    assert len(detail["inserted_ids"]) == 2
+
+
+# ------------------------------
+# Output formats
+# ------------------------------
+def test_config_format_json(client, make_agent):
+    agent = make_agent(("prometheus", "otlp"))
+    url = f"/api/agents/{agent['id']}/config"
+    as_yaml = client.post(url, json={"signals": ["metrics", "traces"]})
+    as_json = client.post(url, params={"format": "json"}, json={"signals": ["metrics", "traces"]})
+    assert as_yaml.headers["content-type"].startswith("text/yaml")
+    assert as_json.headers["content-type"] == "application/json"
+    assert json.loads(as_json.content) == yaml.safe_load(as_yaml.content)
+
+
+def test_config_format_rejects_unknown(client, make_agent):
+    agent = make_agent()
+    assert client.post(f"/api/agents/{agent['id']}/config", params={"format": "toml"}, json={}).status_code == 422
+
+
+# ------------------------------
+# ETag / If-None-Match
+# ------------------------------
+def test_get_config_conditional(client, make_agent):
+    agent = make_agent()
+    url = f"/api/agents/{agent['id']}/config"
+    res = client.get(url)
+    assert res.status_code == 200
+    assert res.headers["cache-control"] == "no-cache"
+    etag = res.headers["etag"]
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        res = client.get(url, headers={"If-None-Match": header})
+        assert res.status_code == 304, header
+        assert res.content == b""
+        assert res.headers["etag"] == etag
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_post_config_ignores_if_none_match(client, make_agent):
+    agent = make_agent()
+    url = f"/api/agents/{agent['id']}/config"
+    first = client.post(url, json={})
+    assert first.headers["cache-control"] == "no-cache"
+    res = client.post(url, json={}, headers={"If-None-Match": first.headers["etag"]})
+    assert res.status_code == 200
+    assert res.headers["etag"] == first.headers["etag"]
+
+
+def test_get_and_post_config_agree(client, make_agent):
+    agent = make_agent()
+    url = f"/api/agents/{agent['id']}/config"
+    post = client.post(url, json={"signals": ["logs", "metrics"], "prometheus_exporter_port": 9999})
+    get = client.get(url, params={"signals": ["metrics", "logs"], "prometheus_exporter_port": 9999})
+    assert post.content == get.content
+    assert post.headers["etag"] == get.headers["etag"]
+
+
+def test_etag_differs_by_format(client, make_agent):
+    agent = make_agent()
+    url = f"/api/agents/{agent['id']}/config"
+    assert client.get(url).headers["etag"] != client.get(url, params={"format": "json"}).headers["etag"]
+
+
+# ------------------------------
+# Exporter builder table
+# ------------------------------
+class _Agent:
+    scrape_targets = []
+
+
+@pytest.mark.parametrize("sink, port, expected", [
+    ({"type": "prometheus", "config": {}}, None,
+     {"prometheus": {"endpoint": "0.0.0.0:8889", "namespace": "aether"}}),
+    ({"type": "prometheus", "config": {}}, 9100,
+     {"prometheus": {"endpoint": "0.0.0.0:9100", "namespace": "aether"}}),
+    ({"type": "otlp", "config": {}}, None,
+     {"otlp": {"endpoint": "localhost:4317", "tls": {"insecure": True}}}),
+    ({"type": "otlp", "config": {"endpoint": "col:4317", "insecure": False}}, None,
+     {"otlp": {"endpoint": "col:4317"}}),
+    ({"type": "kafka", "config": {}}, None,
+     {"kafka": {"brokers": ["localhost:9092"], "topic": "otlp_data"}}),
+    ({"type": "kafka", "config": {"brokers": ["k:1"], "topic": "t"}}, None,
+     {"kafka": {"brokers": ["k:1"], "topic": "t"}}),
+    ({"type": "splunk_hec", "config": {}}, None,
+     {"splunk_hec": {"token": "CHANGE_ME", "endpoint": "https://splunk:8088/services/collector", "insecure_skip_verify": True}}),
+    ({"type": "elasticsearch", "config": {}}, None,
+     {"elasticsearch": {"endpoints": ["http://elasticsearch:9200"], "index": "app-logs-%{+yyyy.MM.dd}"}}),
+])
+def test_exporter_builders(sink, port, expected):
+    # Expected values are the outputs of the former if/elif chain
+    cfg = server._build_collector_config(_Agent(), [sink], ["metrics"], port)
+    assert cfg["exporters"] == expected
+    assert cfg["service"]["pipelines"]["metrics"]["exporters"] == list(expected)
+
+
+def test_exporter_builders_skip_unknown_types():
+    cfg = server._build_collector_config(_Agent(), [{"type": "bogus", "config": {}}], ["metrics"], None)
+    assert cfg["exporters"] == {"prometheus": {"endpoint": "0.0.0.0:8889"}}
+    assert cfg["service"]["pipelines"]["metrics"]["exporters"] == ["prometheus"]